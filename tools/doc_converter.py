@@ -7,69 +7,216 @@ Converts various document formats to markdown for Claude Code processing
 import os
 import sys
 import argparse
+import copy
+import gc
+import importlib
 import logging
+import pickle
+import shutil
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, Optional, Any
 from datetime import datetime
 import json
 
-# Import libraries for different document types
-try:
-    import docx
-    from docx.document import Document as DocxDocument
-except ImportError:
-    docx = None
-
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
-
-try:
-    import openpyxl
-except ImportError:
-    openpyxl = None
-
-try:
-    import PyPDF2
-    import pdfplumber
-except ImportError:
-    PyPDF2 = None
-    pdfplumber = None
-
-try:
-    import mammoth
-except ImportError:
-    mammoth = None
-
 import re
-from html import unescape
-import markdown
+from html.parser import HTMLParser
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocxDocument
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional document libraries, imported on first use so that converting a text
+# file does not pay for importing pandas; None marks a library that is missing
+_lazy: Dict[str, Any] = {}
+
+
+def _load(module_name: str) -> Optional[Any]:
+    """Import an optional dependency on first use, returning None if it is not installed"""
+    if module_name not in _lazy:
+        try:
+            _lazy[module_name] = importlib.import_module(module_name)
+        except ImportError:
+            _lazy[module_name] = None
+    return _lazy[module_name]
+
+
+def _load_pymupdf() -> Optional[Any]:
+    """Import PyMuPDF, which older releases only provide under the fitz name"""
+    return _load('pymupdf') or _load('fitz')
+
+
+# Markdown emitted for the opening and closing of each HTML tag we translate
+_HTML_TAG_MARKDOWN = {
+    'h1': ('# ', ''),
+    'h2': ('## ', ''),
+    'h3': ('### ', ''),
+    'h4': ('#### ', ''),
+    'h5': ('##### ', ''),
+    'h6': ('###### ', ''),
+    'strong': ('**', '**'),
+    'b': ('**', '**'),
+    'em': ('*', '*'),
+    'i': ('*', '*'),
+    'p': ('\n', '\n'),
+    'br': ('\n', ''),
+}
+
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Markdown prefix for each DOCX heading style, keyed by Word's name and its lowercase form
+_HEADING_PREFIX = {
+    name.format(level): '#' * level + ' '
+    for level in range(1, 7)
+    for name in ('Heading {}', 'heading {}')
+}
+
+# Strings that YAML reads back unchanged without quotes; anything else is JSON-quoted
+_SAFE_YAML_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_./-]*')
+_YAML_RESERVED_WORDS = frozenset({'y', 'n', 'yes', 'no', 'on', 'off', 'true', 'false', 'null'})
+
+# Large PDFs are split into page ranges that are extracted in separate processes
+_PARALLEL_PDF_MIN_PAGES = 64
+_PARALLEL_PDF_WORKERS = 4
+
+# Column names recorded in spreadsheet/CSV metadata are capped to keep results small
+_MAX_LISTED_COLUMNS = 64
+
+# Batch workers run a full garbage collection after this many conversions, since
+# PDF parsers leave reference cycles behind that would otherwise pile up
+_GC_EVERY_CONVERSIONS = 50
+_worker_conversions = 0
+
+# Read buffer for binary inputs that are parsed incrementally (DOCX, PDF)
+_READ_BUFFER_SIZE = 1 << 20
+
+# RTF is ASCII in its control plane, so it is stripped as bytes before decoding
+_RTF_GROUP_RE = re.compile(rb'\{[^}]*\}')
+_RTF_CONTROL_RE = re.compile(rb'\\[a-z]+\d*')
+_RTF_WHITESPACE_RE = re.compile(rb'\s+')
+
+
+def _yaml_scalar(value: str) -> str:
+    """Format a string for YAML frontmatter, quoting only when it is needed"""
+    if _SAFE_YAML_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED_WORDS:
+        return value
+    return json.dumps(value)
+
+
+def _cell_text(value: Any) -> str:
+    """Format a table cell, leaving None empty and whole-number floats without '.0'"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _table_to_markdown(columns: Iterable[Any], rows: Iterable[Iterable[Any]]) -> str:
+    """Render rows as a markdown table, leaving None cells empty"""
+    columns = [str(column) for column in columns]
+    lines = [
+        "| " + " | ".join(columns) + " |",
+        "|" + "|".join(" --- " for _ in columns) + "|",
+    ]
+    lines.extend(
+        "| " + " | ".join(_cell_text(value) for value in row) + " |"
+        for row in rows
+    )
+    return "\n".join(lines)
+
+
+def _dataframe_to_markdown(df: Any) -> str:
+    """Render a pandas DataFrame as a markdown table, leaving missing values empty"""
+    values = df.astype(object).where(df.notna(), None).to_numpy()
+    return _table_to_markdown(df.columns, values)
+
+
+def _page_headers(page_count: int) -> List[str]:
+    """Build the markdown heading of every PDF page before extracting their text"""
+    return [f"## Page {i}\n\n" for i in range(1, page_count + 1)]
+
+
+class _MdEmitter(HTMLParser):
+    """Translate HTML to markdown in a single pass over the document"""
+    
+    def __init__(self):
+        # convert_charrefs unescapes entities in each text run as it is emitted
+        super().__init__(convert_charrefs=True)
+        self.buf: List[str] = []
+    
+    def handle_starttag(self, tag: str, attrs: List[Any]) -> None:
+        markup = _HTML_TAG_MARKDOWN.get(tag)
+        if markup:
+            self.buf.append(markup[0])
+    
+    def handle_endtag(self, tag: str) -> None:
+        markup = _HTML_TAG_MARKDOWN.get(tag)
+        if markup:
+            self.buf.append(markup[1])
+    
+    def handle_data(self, data: str) -> None:
+        self.buf.append(data)
+
+
+def _iter_files(root: Path, suffixes: FrozenSet[str], recursive: bool = True,
+                exclude: Optional[Path] = None) -> Iterator[Path]:
+    """Yield files under root with a supported suffix, checking the name before any stat"""
+    # Subdirectories resolving to exclude (the converter's own output) are not walked
+    excluded = os.path.realpath(exclude) if exclude is not None else None
+    pending = deque([root])
+    
+    while pending:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Directory entries carry their type, so is_dir/is_file rarely need a stat
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and os.path.realpath(entry.path) != excluded:
+                            pending.append(entry.path)
+                        continue
+                    
+                    # Match Path.suffix: a name needs a stem before its last dot ('md', '.md' have none)
+                    stem, dot, extension = entry.name.rpartition('.')
+                    if dot and stem and '.' + extension.lower() in suffixes and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {directory}: {e}")
+
+
 class DocumentConverter:
     """Convert various document formats to markdown"""
     
-    def __init__(self, output_dir: str = "converted_docs"):
+    # Supported file extensions, mapped to the name of their converter method
+    supported_formats = {
+        '.docx': '_convert_docx',
+        '.doc': '_convert_docx',
+        '.xlsx': '_convert_excel',
+        '.xls': '_convert_excel',
+        '.pdf': '_convert_pdf',
+        '.txt': '_convert_text',
+        '.md': '_copy_markdown',
+        '.html': '_convert_html',
+        '.rtf': '_convert_rtf',
+        '.csv': '_convert_csv'
+    }
+    
+    # Extensions handled by supported_formats, for matching raw file names cheaply
+    SUPPORTED_SUFFIXES = frozenset(supported_formats)
+    
+    def __init__(self, output_dir: str = "converted_docs", parallel_pages: bool = False):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
-        
-        # Supported file extensions
-        self.supported_formats = {
-            '.docx': self._convert_docx,
-            '.doc': self._convert_docx,
-            '.xlsx': self._convert_excel,
-            '.xls': self._convert_excel,
-            '.pdf': self._convert_pdf,
-            '.txt': self._convert_text,
-            '.md': self._copy_markdown,
-            '.html': self._convert_html,
-            '.rtf': self._convert_rtf,
-            '.csv': self._convert_csv
-        }
+        # Opt-in: splitting large PDFs across processes needs a __main__ guard on spawn platforms
+        self.parallel_pages = parallel_pages
+        # The output directory is created on the first conversion, not here
+        self._output_dir_ready = False
     
     def convert_file(self, file_path: str, output_name: Optional[str] = None) -> Dict[str, Any]:
         """Convert a single file to markdown"""
@@ -91,8 +238,12 @@ class DocumentConverter:
         
         logger.info(f"Converting {file_path} to {output_file}")
         
+        if not self._output_dir_ready:
+            self.output_dir.mkdir(exist_ok=True)
+            self._output_dir_ready = True
+        
         # Convert using appropriate method
-        converter = self.supported_formats[extension]
+        converter = getattr(self, self.supported_formats[extension])
         result = converter(file_path, output_file)
         
         # Add metadata
@@ -108,37 +259,85 @@ class DocumentConverter:
     def convert_directory(self, directory: str, recursive: bool = True) -> List[Dict[str, Any]]:
         """Convert all supported files in a directory"""
         directory = Path(directory)
-        results = []
-        
-        if recursive:
-            pattern = "**/*"
-        else:
-            pattern = "*"
-        
-        for file_path in directory.glob(pattern):
-            if file_path.is_file() and file_path.suffix.lower() in self.supported_formats:
-                try:
-                    result = self.convert_file(file_path)
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Failed to convert {file_path}: {e}")
-                    results.append({
-                        'input_file': str(file_path),
-                        'error': str(e),
+        paths = list(_iter_files(directory, self.SUPPORTED_SUFFIXES, recursive,
+                                 exclude=self.output_dir))
+        
+        # Files run concurrently, so inputs sharing an output name (a.txt, sub/a.md)
+        # are converted one at a time: the next is tried only if the previous failed
+        candidates: Dict[str, deque] = {}
+        for file_path in paths:
+            candidates.setdefault(f"{file_path.stem}.md", deque()).append(file_path)
+        
+        outcomes: Dict[Path, Dict[str, Any]] = {}
+        while candidates:
+            batch = {output_name: queue.popleft() for output_name, queue in candidates.items()}
+            results = self._convert_many(list(batch.values()))
+            
+            for (output_name, file_path), result in zip(batch.items(), results):
+                outcomes[file_path] = result
+                queue = candidates[output_name]
+                if result.get('status') == 'failed' and queue:
+                    continue
+                
+                for duplicate in queue:
+                    error = f"Output {output_name} is already produced by {file_path}"
+                    logger.error(f"Failed to convert {duplicate}: {error}")
+                    outcomes[duplicate] = {
+                        'input_file': str(duplicate),
+                        'error': error,
                         'status': 'failed'
-                    })
+                    }
+                del candidates[output_name]
         
-        return results
+        return [outcomes[file_path] for file_path in paths]
+    
+    def _convert_many(self, paths: List[Path]) -> List[Dict[str, Any]]:
+        """Convert files across worker processes, returning results in input order"""
+        if len(paths) > 1:
+            self.output_dir.mkdir(exist_ok=True)
+            self._output_dir_ready = True
+            
+            # Workers get a copy of this converter, so subclasses and their state carry
+            # over; they already use every core, so they must not split PDFs further
+            worker = copy.copy(self)
+            worker.parallel_pages = False
+            try:
+                pickle.dumps(worker)
+            except Exception as e:
+                logger.debug(f"Converter cannot be sent to worker processes, converting serially: {e}")
+            else:
+                # Each conversion is CPU-bound and independent, so fan out across processes
+                convert = partial(_convert_one_path, worker)
+                with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+                    return list(executor.map(convert, paths, chunksize=4))
+        
+        return [self._convert_reporting_errors(file_path) for file_path in paths]
+    
+    def _convert_reporting_errors(self, file_path: Path) -> Dict[str, Any]:
+        """Convert a single file, reporting a failure as a result instead of raising"""
+        try:
+            return self.convert_file(file_path)
+        except Exception as e:
+            logger.error(f"Failed to convert {file_path}: {e}")
+            return {
+                'input_file': str(file_path),
+                'error': str(e),
+                'status': 'failed'
+            }
     
     def _convert_docx(self, file_path: Path, output_file: Path) -> Dict[str, Any]:
         """Convert Word document to markdown"""
+        docx = _load('docx')
         if docx is None:
             raise ImportError("python-docx not installed. Run: pip install python-docx")
         
         try:
+            doc = None
+            
             # Try mammoth for better HTML conversion if available
+            mammoth = _load('mammoth')
             if mammoth:
-                with open(file_path, "rb") as docx_file:
+                with open(file_path, "rb", buffering=_READ_BUFFER_SIZE) as docx_file:
                     result = mammoth.convert_to_html(docx_file)
                     html_content = result.html
                     markdown_content = self._html_to_markdown(html_content)
@@ -147,12 +346,11 @@ class DocumentConverter:
                 doc = docx.Document(file_path)
                 markdown_content = self._docx_to_markdown(doc)
             
-            # Add document metadata
-            metadata = self._extract_docx_metadata(file_path)
+            # Add document metadata, reusing the parsed document when there is one
+            metadata = self._extract_docx_metadata(file_path, doc)
             full_content = self._add_frontmatter(markdown_content, metadata)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+            self._write_output(output_file, full_content)
             
             return {
                 'status': 'success',
@@ -166,36 +364,39 @@ class DocumentConverter:
     
     def _convert_excel(self, file_path: Path, output_file: Path) -> Dict[str, Any]:
         """Convert Excel file to markdown"""
-        if pd is None:
+        if _load('pandas') is None:
             raise ImportError("pandas not installed. Run: pip install pandas openpyxl")
         
         try:
-            # Read all sheets
-            excel_file = pd.ExcelFile(file_path)
-            markdown_content = f"# {file_path.stem}\n\n"
+            # Read all sheets in a single pass over the workbook
+            sheets = self._read_excel_sheets(file_path)
+            parts = [f"# {file_path.stem}\n\n"]
             
             sheet_info = []
             
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
+            # Pop each sheet so its DataFrame is freed once it has been rendered
+            for sheet_name in list(sheets):
+                df = sheets.pop(sheet_name)
                 
                 # Skip empty sheets
                 if df.empty:
                     continue
                 
-                markdown_content += f"## {sheet_name}\n\n"
+                parts.append(f"## {sheet_name}\n\n")
                 
                 # Convert to markdown table
-                markdown_table = df.to_markdown(index=False)
-                markdown_content += markdown_table + "\n\n"
+                parts.append(_dataframe_to_markdown(df))
+                parts.append("\n\n")
                 
                 sheet_info.append({
                     'name': sheet_name,
                     'rows': len(df),
                     'columns': len(df.columns),
-                    'columns_list': df.columns.tolist()
+                    'columns_list': df.columns[:_MAX_LISTED_COLUMNS].tolist()
                 })
             
+            markdown_content = "".join(parts)
+            
             metadata = {
                 'file_type': 'spreadsheet',
                 'sheets': sheet_info,
@@ -204,8 +405,7 @@ class DocumentConverter:
             
             full_content = self._add_frontmatter(markdown_content, metadata)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+            self._write_output(output_file, full_content)
             
             return {
                 'status': 'success',
@@ -217,33 +417,78 @@ class DocumentConverter:
         except Exception as e:
             raise Exception(f"Failed to convert Excel: {e}")
     
+    def _read_excel_sheets(self, file_path: Path) -> Dict[str, Any]:
+        """Read every sheet of a workbook, preferring the calamine engine when installed"""
+        pd = _load('pandas')
+        
+        if _load('python_calamine'):
+            try:
+                return pd.read_excel(file_path, sheet_name=None, engine='calamine')
+            except ValueError:
+                # pandas older than 2.2 does not know the calamine engine
+                logger.debug("calamine engine unavailable, falling back to default Excel engine")
+        
+        return pd.read_excel(file_path, sheet_name=None)
+    
     def _convert_pdf(self, file_path: Path, output_file: Path) -> Dict[str, Any]:
         """Convert PDF to markdown"""
-        markdown_content = ""
+        parts: List[str] = []
         page_count = 0
         
         try:
-            # Try pdfplumber first (better text extraction)
-            if pdfplumber:
+            # Try PyMuPDF first (native MuPDF text extraction, by far the fastest)
+            if _load_pymupdf():
+                texts = self._pymupdf_page_texts(file_path)
+                page_count = len(texts)
+                headers = _page_headers(page_count)
+                for i, text in enumerate(texts):
+                    if text:
+                        parts.extend((headers[i], text, "\n\n"))
+            
+            elif (pypdfium2 := _load('pypdfium2')):
+                pdf = pypdfium2.PdfDocument(file_path)
+                try:
+                    page_count = len(pdf)
+                    headers = _page_headers(page_count)
+                    for i, page in enumerate(pdf):
+                        try:
+                            textpage = page.get_textpage()
+                            try:
+                                text = textpage.get_text_range()
+                            finally:
+                                textpage.close()
+                        finally:
+                            page.close()
+                        if text:
+                            parts.extend((headers[i], text, "\n\n"))
+                finally:
+                    pdf.close()
+            
+            # pdfplumber is slower but kept for its text extraction accuracy
+            elif (pdfplumber := _load('pdfplumber')):
                 with pdfplumber.open(file_path) as pdf:
                     page_count = len(pdf.pages)
-                    for i, page in enumerate(pdf.pages, 1):
+                    headers = _page_headers(page_count)
+                    for i, page in enumerate(pdf.pages):
                         text = page.extract_text()
                         if text:
-                            markdown_content += f"## Page {i}\n\n{text}\n\n"
+                            parts.extend((headers[i], text, "\n\n"))
             
             # Fallback to PyPDF2
-            elif PyPDF2:
-                with open(file_path, 'rb') as pdf_file:
+            elif (PyPDF2 := _load('PyPDF2')):
+                with open(file_path, 'rb', buffering=_READ_BUFFER_SIZE) as pdf_file:
                     pdf_reader = PyPDF2.PdfReader(pdf_file)
                     page_count = len(pdf_reader.pages)
+                    headers = _page_headers(page_count)
                     
-                    for i, page in enumerate(pdf_reader.pages, 1):
+                    for i, page in enumerate(pdf_reader.pages):
                         text = page.extract_text()
                         if text:
-                            markdown_content += f"## Page {i}\n\n{text}\n\n"
+                            parts.extend((headers[i], text, "\n\n"))
             else:
-                raise ImportError("No PDF library available. Install: pip install pdfplumber")
+                raise ImportError("No PDF library available. Install: pip install pymupdf")
+            
+            markdown_content = "".join(parts)
             
             if not markdown_content.strip():
                 markdown_content = f"# {file_path.stem}\n\n*PDF content could not be extracted as text*\n"
@@ -256,8 +501,7 @@ class DocumentConverter:
             
             full_content = self._add_frontmatter(markdown_content, metadata)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+            self._write_output(output_file, full_content)
             
             return {
                 'status': 'success',
@@ -269,11 +513,35 @@ class DocumentConverter:
         except Exception as e:
             raise Exception(f"Failed to convert PDF: {e}")
     
+    def _pymupdf_page_texts(self, file_path: Path) -> List[str]:
+        """Extract page texts with PyMuPDF, splitting large documents across processes"""
+        pymupdf = _load_pymupdf()
+        workers = min(_PARALLEL_PDF_WORKERS, os.cpu_count() or 1)
+        
+        with pymupdf.open(file_path) as doc:
+            page_count = doc.page_count
+            # PyMuPDF is not thread-safe, so parallel extraction needs processes
+            if not self.parallel_pages or page_count < _PARALLEL_PDF_MIN_PAGES or workers < 2:
+                return [page.get_text("text") for page in doc]
+            
+            # The first page range is extracted here from the already open document
+            # while the other ranges are handed to worker processes
+            step = -(-page_count // workers)
+            starts = range(step, page_count, step)
+            stops = [min(start + step, page_count) for start in starts]
+            
+            with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+                chunks = executor.map(_extract_pymupdf_pages, repeat(str(file_path)), starts, stops)
+                texts = [doc.load_page(i).get_text("text") for i in range(step)]
+                for chunk in chunks:
+                    texts.extend(chunk)
+            
+            return texts
+    
     def _convert_text(self, file_path: Path, output_file: Path) -> Dict[str, Any]:
         """Convert plain text to markdown"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = file_path.read_text(encoding='utf-8')
             
             # Basic text-to-markdown conversion
             markdown_content = f"# {file_path.stem}\n\n{content}"
@@ -285,8 +553,7 @@ class DocumentConverter:
             
             full_content = self._add_frontmatter(markdown_content, metadata)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+            self._write_output(output_file, full_content)
             
             return {
                 'status': 'success',
@@ -300,27 +567,35 @@ class DocumentConverter:
     
     def _convert_csv(self, file_path: Path, output_file: Path) -> Dict[str, Any]:
         """Convert CSV to markdown table"""
-        if pd is None:
+        pl = _load('polars')
+        pd = None if pl else _load('pandas')
+        if pl is None and pd is None:
             raise ImportError("pandas not installed. Run: pip install pandas")
         
         try:
-            df = pd.read_csv(file_path)
-            
             markdown_content = f"# {file_path.stem}\n\n"
-            markdown_table = df.to_markdown(index=False)
-            markdown_content += markdown_table
+            
+            if pl:
+                # polars parses in parallel; every column is read as text since
+                # the values only end up in a markdown table
+                df = pl.read_csv(file_path, infer_schema_length=0)
+                columns = df.columns
+                markdown_content += _table_to_markdown(columns, df.iter_rows())
+            else:
+                df = pd.read_csv(file_path)
+                columns = df.columns.tolist()
+                markdown_content += _dataframe_to_markdown(df)
             
             metadata = {
                 'file_type': 'csv',
                 'rows': len(df),
-                'columns': len(df.columns),
-                'columns_list': df.columns.tolist()
+                'columns': len(columns),
+                'columns_list': columns[:_MAX_LISTED_COLUMNS]
             }
             
             full_content = self._add_frontmatter(markdown_content, metadata)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+            self._write_output(output_file, full_content)
             
             return {
                 'status': 'success',
@@ -335,11 +610,12 @@ class DocumentConverter:
     def _copy_markdown(self, file_path: Path, output_file: Path) -> Dict[str, Any]:
         """Copy existing markdown file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Copy in-kernel where supported; the content is not decoded
+            try:
+                shutil.copyfile(file_path, output_file)
+            except shutil.SameFileError:
+                # Re-running over a tree that contains the output directory
+                logger.debug(f"{file_path} is already in the output directory")
             
             return {
                 'status': 'success',
@@ -353,13 +629,11 @@ class DocumentConverter:
     def _convert_html(self, file_path: Path, output_file: Path) -> Dict[str, Any]:
         """Convert HTML to markdown"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = file_path.read_text(encoding='utf-8')
             
             markdown_content = self._html_to_markdown(html_content)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            self._write_output(output_file, markdown_content)
             
             return {
                 'status': 'success',
@@ -373,18 +647,17 @@ class DocumentConverter:
     def _convert_rtf(self, file_path: Path, output_file: Path) -> Dict[str, Any]:
         """Basic RTF to text conversion"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                rtf_content = f.read()
+            rtf_content = file_path.read_bytes()
             
             # Very basic RTF stripping - remove RTF codes
-            text_content = re.sub(r'\{[^}]*\}', '', rtf_content)
-            text_content = re.sub(r'\\[a-z]+\d*', '', text_content)
-            text_content = re.sub(r'\s+', ' ', text_content).strip()
+            text_content = _RTF_GROUP_RE.sub(b'', rtf_content)
+            text_content = _RTF_CONTROL_RE.sub(b'', text_content)
+            text_content = _RTF_WHITESPACE_RE.sub(b' ', text_content).strip()
+            text_content = text_content.decode('latin-1')
             
             markdown_content = f"# {file_path.stem}\n\n{text_content}"
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            self._write_output(output_file, markdown_content)
             
             return {
                 'status': 'success',
@@ -395,7 +668,11 @@ class DocumentConverter:
         except Exception as e:
             raise Exception(f"Failed to convert RTF: {e}")
     
-    def _docx_to_markdown(self, doc: DocxDocument) -> str:
+    def _write_output(self, output_file: Path, content: str) -> None:
+        """Write converted markdown to the output file in a single call"""
+        output_file.write_text(content, encoding='utf-8')
+    
+    def _docx_to_markdown(self, doc: 'DocxDocument') -> str:
         """Convert DOCX document to markdown using python-docx"""
         markdown_lines = []
         
@@ -406,36 +683,29 @@ class DocumentConverter:
                 continue
             
             # Handle different paragraph styles
-            style = paragraph.style.name.lower()
-            
-            if 'heading 1' in style:
-                markdown_lines.append(f"# {text}")
-            elif 'heading 2' in style:
-                markdown_lines.append(f"## {text}")
-            elif 'heading 3' in style:
-                markdown_lines.append(f"### {text}")
-            elif 'heading 4' in style:
-                markdown_lines.append(f"#### {text}")
-            elif 'heading 5' in style:
-                markdown_lines.append(f"##### {text}")
-            elif 'heading 6' in style:
-                markdown_lines.append(f"###### {text}")
-            else:
-                markdown_lines.append(text)
+            style = paragraph.style.name
+            if style not in _HEADING_PREFIX:
+                style = style.lower()
+            
+            markdown_lines.append(_HEADING_PREFIX.get(style, '') + text)
         
         # Handle tables
         for table in doc.tables:
-            markdown_lines.append("")  # Add space before table
+            rows = iter(table.rows)
+            header = next(rows, None)
+            if header is None:
+                continue
             
-            # Header row
-            header_cells = [cell.text.strip() for cell in table.rows[0].cells]
-            markdown_lines.append("| " + " | ".join(header_cells) + " |")
-            markdown_lines.append("| " + " | ".join(["---"] * len(header_cells)) + " |")
+            # Header row and separator, with a blank line before the table
+            header_cells = [cell.text.strip() for cell in header.cells]
+            separator = "|" + "|".join(" --- " for _ in header_cells) + "|"
+            markdown_lines += ["", "| " + " | ".join(header_cells) + " |", separator]
             
             # Data rows
-            for row in table.rows[1:]:
-                cells = [cell.text.strip() for cell in row.cells]
-                markdown_lines.append("| " + " | ".join(cells) + " |")
+            markdown_lines.extend(
+                "| " + " | ".join(cell.text.strip() for cell in row.cells) + " |"
+                for row in rows
+            )
             
             markdown_lines.append("")  # Add space after table
         
@@ -443,44 +713,22 @@ class DocumentConverter:
     
     def _html_to_markdown(self, html_content: str) -> str:
         """Convert HTML to markdown"""
-        # Basic HTML to markdown conversion
-        # Remove HTML tags and convert common elements
-        
-        # Replace common HTML elements
-        html_content = re.sub(r'<h1[^>]*>(.*?)</h1>', r'# \1', html_content)
-        html_content = re.sub(r'<h2[^>]*>(.*?)</h2>', r'## \1', html_content)
-        html_content = re.sub(r'<h3[^>]*>(.*?)</h3>', r'### \1', html_content)
-        html_content = re.sub(r'<h4[^>]*>(.*?)</h4>', r'#### \1', html_content)
-        html_content = re.sub(r'<h5[^>]*>(.*?)</h5>', r'##### \1', html_content)
-        html_content = re.sub(r'<h6[^>]*>(.*?)</h6>', r'###### \1', html_content)
-        
-        html_content = re.sub(r'<strong[^>]*>(.*?)</strong>', r'**\1**', html_content)
-        html_content = re.sub(r'<b[^>]*>(.*?)</b>', r'**\1**', html_content)
-        html_content = re.sub(r'<em[^>]*>(.*?)</em>', r'*\1*', html_content)
-        html_content = re.sub(r'<i[^>]*>(.*?)</i>', r'*\1*', html_content)
-        
-        html_content = re.sub(r'<p[^>]*>', '\n', html_content)
-        html_content = re.sub(r'</p>', '\n', html_content)
-        html_content = re.sub(r'<br[^>]*>', '\n', html_content)
-        
-        # Remove all other HTML tags
-        html_content = re.sub(r'<[^>]+>', '', html_content)
-        
-        # Unescape HTML entities
-        html_content = unescape(html_content)
+        parser = _MdEmitter()
+        parser.feed(html_content)
+        parser.close()
         
         # Clean up whitespace
-        html_content = re.sub(r'\n\s*\n', '\n\n', html_content)
-        
-        return html_content.strip()
+        return _BLANK_LINES_RE.sub('\n\n', ''.join(parser.buf)).strip()
     
-    def _extract_docx_metadata(self, file_path: Path) -> Dict[str, Any]:
-        """Extract metadata from DOCX file"""
+    def _extract_docx_metadata(self, file_path: Path, doc: Optional['DocxDocument'] = None) -> Dict[str, Any]:
+        """Extract metadata from DOCX file, parsing it only if doc is not given"""
+        docx = _load('docx')
         if docx is None:
             return {'file_type': 'document'}
         
         try:
-            doc = docx.Document(file_path)
+            if doc is None:
+                doc = docx.Document(file_path)
             core_props = doc.core_properties
             
             metadata = {
@@ -507,7 +755,7 @@ class DocumentConverter:
             if isinstance(value, list):
                 frontmatter_lines.append(f"{key}: {json.dumps(value)}")
             elif isinstance(value, str):
-                frontmatter_lines.append(f"{key}: {json.dumps(value)}")
+                frontmatter_lines.append(f"{key}: {_yaml_scalar(value)}")
             else:
                 frontmatter_lines.append(f"{key}: {value}")
         
@@ -522,6 +770,25 @@ class DocumentConverter:
         return "\n".join(frontmatter_lines) + content
 
 
+def _convert_one_path(converter: 'DocumentConverter', file_path: Path) -> Dict[str, Any]:
+    """Convert a single file in a worker process, reporting failures as a result"""
+    global _worker_conversions
+    
+    try:
+        return converter._convert_reporting_errors(file_path)
+    finally:
+        _worker_conversions += 1
+        if _worker_conversions % _GC_EVERY_CONVERSIONS == 0:
+            gc.collect()
+
+
+def _extract_pymupdf_pages(file_path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) in a worker process"""
+    pymupdf = _load_pymupdf()
+    with pymupdf.open(file_path) as doc:
+        return [doc.load_page(i).get_text("text") for i in range(start, stop)]
+
+
 def main():
     """Command line interface"""
     parser = argparse.ArgumentParser(description="Convert documents to markdown for OSC-Proj")
@@ -536,7 +803,7 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    converter = DocumentConverter(args.output)
+    converter = DocumentConverter(args.output, parallel_pages=True)
     
     input_path = Path(args.input)
     